@@ -1,4 +1,6 @@
+import sys
 from dataclasses import dataclass
+from typing import Any
 from typing import ClassVar
 from typing import Dict
 from typing import Optional
@@ -24,9 +26,49 @@ class DatabricksColumn(SparkColumn):
         column_type = cls.translate_type(label_or_dtype)
         return cls(name, column_type)
 
+    @staticmethod
+    def convert_table_stats(raw_stats: Optional[str]) -> Dict[str, Any]:
+        table_stats: Dict[str, Any] = {}
+        if raw_stats:
+            # format: 1109049927 bytes, 14093476 rows
+            for stat in raw_stats.split(", "):
+                value, _, rest = stat.partition(" ")
+                key = sys.intern(rest.partition(" ")[0])
+                table_stats[f"stats:{key}:label"] = key
+                table_stats[f"stats:{key}:value"] = int(value)
+                table_stats[f"stats:{key}:description"] = ""
+                table_stats[f"stats:{key}:include"] = True
+        return table_stats
+
     @property
     def data_type(self) -> str:
         return self.translate_type(self.dtype)
 
     def __repr__(self) -> str:
         return "<DatabricksColumn {} ({})>".format(self.name, self.data_type)
+
+    def to_column_dict(self, omit_none: bool = True, validate: bool = False) -> Dict[str, Any]:
+        """Same result as SparkColumn.to_column_dict, built from the fields directly rather
+        than through the generic dataclass serializer.
+        """
+        column_dict: Dict[str, Any] = {
+            "column": self.column,
+            "dtype": self.dtype,
+            "char_size": self.char_size,
+            "numeric_precision": self.numeric_precision,
+            "numeric_scale": self.numeric_scale,
+            "table_database": self.table_database,
+            "table_schema": self.table_schema,
+            "table_name": self.table_name,
+            "table_type": self.table_type,
+            "table_owner": self.table_owner,
+            "column_index": self.column_index,
+            "table_comment": self.table_comment,
+            "comment": self.comment,
+        }
+        if omit_none:
+            column_dict = {k: v for k, v in column_dict.items() if v is not None}
+        # If there are stats, merge them into the root of the dict
+        if self.table_stats:
+            column_dict.update(self.table_stats)
+        return column_dict
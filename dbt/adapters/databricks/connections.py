@@ -698,6 +698,35 @@ class DatabricksConnectionManager(SparkConnectionManager):
             ),
         )
 
+    @classmethod
+    def _get_connect_kwargs(
+        cls, creds: DatabricksCredentials, http_path: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build the keyword arguments passed to `dbsql.connect` for the given credentials."""
+        invocation_env = creds.get_invocation_env()
+        user_agent_entry = cls._user_agent
+        if invocation_env:
+            user_agent_entry = f"{cls._user_agent}; {invocation_env}"
+
+        connection_parameters = creds.connection_parameters.copy()  # type: ignore[union-attr]
+
+        http_headers: List[Tuple[str, str]] = list(
+            creds.get_all_http_headers(connection_parameters.pop("http_headers", {})).items()
+        )
+
+        return dict(
+            server_hostname=creds.host,
+            http_path=http_path,
+            credentials_provider=cls.credentials_provider,
+            http_headers=http_headers if http_headers else None,
+            session_configuration=creds.session_properties,
+            catalog=creds.database,
+            use_inline_params="silent",
+            # schema=creds.schema,  # TODO: Explicitly set once DBR 7.3LTS is EOL.
+            _user_agent_entry=user_agent_entry,
+            **connection_parameters,
+        )
+
     @classmethod
     def get_open_for_context(
         cls, query_header_context: Any = None
@@ -730,36 +759,16 @@ class DatabricksConnectionManager(SparkConnectionManager):
         # gotta keep this so we don't prompt users many times
         cls.credentials_provider = creds.authenticate(cls.credentials_provider)
 
-        invocation_env = creds.get_invocation_env()
-        user_agent_entry = cls._user_agent
-        if invocation_env:
-            user_agent_entry = f"{cls._user_agent}; {invocation_env}"
-
-        connection_parameters = creds.connection_parameters.copy()  # type: ignore[union-attr]
-
-        http_headers: List[Tuple[str, str]] = list(
-            creds.get_all_http_headers(connection_parameters.pop("http_headers", {})).items()
-        )
-
         # If a model specifies a compute resource the http path
         # may be different than the http_path property of creds.
         http_path = _get_http_path(query_header_context, creds)
+        connect_kwargs = cls._get_connect_kwargs(creds, http_path)
+        user_agent_entry = connect_kwargs["_user_agent_entry"]
 
         def connect() -> DatabricksSQLConnectionWrapper:
             try:
                 # TODO: what is the error when a user specifies a catalog they don't have access to
-                conn: DatabricksSQLConnection = dbsql.connect(
-                    server_hostname=creds.host,
-                    http_path=http_path,
-                    credentials_provider=cls.credentials_provider,
-                    http_headers=http_headers if http_headers else None,
-                    session_configuration=creds.session_properties,
-                    catalog=creds.database,
-                    use_inline_params="silent",
-                    # schema=creds.schema,  # TODO: Explicitly set once DBR 7.3LTS is EOL.
-                    _user_agent_entry=user_agent_entry,
-                    **connection_parameters,
-                )
+                conn: DatabricksSQLConnection = dbsql.connect(**connect_kwargs)
                 logger.debug(ConnectionCreated(str(conn)))
 
                 return DatabricksSQLConnectionWrapper(
@@ -1022,36 +1031,16 @@ class ExtendedSessionConnectionManager(DatabricksConnectionManager):
         # gotta keep this so we don't prompt users many times
         cls.credentials_provider = creds.authenticate(cls.credentials_provider)
 
-        invocation_env = creds.get_invocation_env()
-        user_agent_entry = cls._user_agent
-        if invocation_env:
-            user_agent_entry = f"{cls._user_agent}; {invocation_env}"
-
-        connection_parameters = creds.connection_parameters.copy()  # type: ignore[union-attr]
-
-        http_headers: List[Tuple[str, str]] = list(
-            creds.get_all_http_headers(connection_parameters.pop("http_headers", {})).items()
-        )
-
         # If a model specifies a compute resource the http path
         # may be different than the http_path property of creds.
         http_path = databricks_connection.http_path
+        connect_kwargs = cls._get_connect_kwargs(creds, http_path)
+        user_agent_entry = connect_kwargs["_user_agent_entry"]
 
         def connect() -> DatabricksSQLConnectionWrapper:
             try:
                 # TODO: what is the error when a user specifies a catalog they don't have access to
-                conn = dbsql.connect(
-                    server_hostname=creds.host,
-                    http_path=http_path,
-                    credentials_provider=cls.credentials_provider,
-                    http_headers=http_headers if http_headers else None,
-                    session_configuration=creds.session_properties,
-                    catalog=creds.database,
-                    use_inline_params="silent",
-                    # schema=creds.schema,  # TODO: Explicitly set once DBR 7.3LTS is EOL.
-                    _user_agent_entry=user_agent_entry,
-                    **connection_parameters,
-                )
+                conn = dbsql.connect(**connect_kwargs)
 
                 if conn:
                     databricks_connection.session_id = conn.get_session_id_hex()
@@ -1,5 +1,6 @@
 import os
 import re
+import sys
 from abc import ABC
 from abc import abstractmethod
 from collections import defaultdict
@@ -105,11 +106,18 @@ class DatabricksConfig(AdapterConfig):
     zorder: Optional[Union[List[str], str]] = None
 
 
+# Missing schema errors, both new ([SCHEMA_NOT_FOUND]) and old style, and missing table errors
+NOT_FOUND_ERROR_REGEX = re.compile(
+    "|".join(
+        [re.escape("[SCHEMA_NOT_FOUND]"), r"Database.*not found"]
+        + [re.escape(msg) for msg in TABLE_OR_VIEW_NOT_FOUND_MESSAGES]
+    ),
+    re.DOTALL,
+)
+
+
 def check_not_found_error(errmsg: str) -> bool:
-    new_error = "[SCHEMA_NOT_FOUND]" in errmsg
-    old_error = re.match(r".*(Database).*(not found).*", errmsg, re.DOTALL)
-    found_msgs = (msg in errmsg for msg in TABLE_OR_VIEW_NOT_FOUND_MESSAGES)
-    return new_error or old_error is not None or any(found_msgs)
+    return NOT_FOUND_ERROR_REGEX.search(errmsg) is not None
 
 
 T = TypeVar("T")
@@ -126,7 +134,7 @@ def handle_missing_objects(exec: Callable[[], T], default: T) -> T:
 
 
 def get_identifier_list_string(table_names: Set[str]) -> str:
-    """Returns `"|".join(table_names)` by default.
+    """Returns `"|".join(sorted(table_names))` by default.
 
     Returns `"*"` if `DBT_DESCRIBE_TABLE_2048_CHAR_BYPASS` == `"true"`
     and the joined string exceeds 2048 characters
@@ -134,16 +142,26 @@ def get_identifier_list_string(table_names: Set[str]) -> str:
     This is for AWS Glue Catalog users. See issue #325.
     """
 
-    _identifier = "|".join(table_names)
     bypass_2048_char_limit = os.environ.get("DBT_DESCRIBE_TABLE_2048_CHAR_BYPASS", "false")
+    sorted_names = sorted(table_names)
     if bypass_2048_char_limit == "true":
-        _identifier = _identifier if len(_identifier) < 2048 else "*"
-    return _identifier
+        # Length of the joined string, without building it
+        joined_length = sum(map(len, sorted_names)) + max(0, len(sorted_names) - 1)
+        if joined_length >= 2048:
+            return "*"
+    return "|".join(sorted_names)
 
 
 @undefined_proof
 class DatabricksAdapter(SparkAdapter):
     INFORMATION_COMMENT_REGEX = re.compile(r"Comment: (.*)\n[A-Z][A-Za-z ]+:", re.DOTALL)
+    # Owner, statistics and column lines of the information string, matched in a single scan
+    INFORMATION_REGEX = re.compile(
+        r"^Owner: (?P<owner>.*)$"
+        r"|^Statistics: (?P<stats>.*)$"
+        r"|^ \|-- (?P<column_name>.*): (?P<column_type>.*) \(nullable = .*\b",
+        re.MULTILINE,
+    )
 
     Relation = DatabricksRelation
     Column = DatabricksColumn
@@ -355,17 +373,20 @@ class DatabricksAdapter(SparkAdapter):
         rows = [row for row in raw_rows[0:pos] if not row["col_name"].startswith("#")]
         metadata = {col["col_name"]: col["data_type"] for col in raw_rows[pos + 1 :]}
 
+        # Table level attributes are computed once and shared by all of the table's columns
         raw_table_stats = metadata.get(KEY_TABLE_STATISTICS)
         table_stats = DatabricksColumn.convert_table_stats(raw_table_stats)
+        table_owner = str(metadata.get(KEY_TABLE_OWNER))
+        table_comment = metadata.get("Comment")
         return metadata, [
             DatabricksColumn(
                 table_database=relation.database,
                 table_schema=relation.schema,
                 table_name=relation.name,
                 table_type=relation.type,
-                table_owner=str(metadata.get(KEY_TABLE_OWNER)),
+                table_owner=table_owner,
                 table_stats=table_stats,
-                table_comment=metadata.get("Comment"),
+                table_comment=table_comment,
                 column=column["col_name"],
                 column_index=idx,
                 dtype=column["data_type"],
@@ -436,19 +457,26 @@ class DatabricksAdapter(SparkAdapter):
     def parse_columns_from_information(  # type: ignore[override]
         self, relation: DatabricksRelation, information: str
     ) -> List[DatabricksColumn]:
-        owner_match = re.findall(self.INFORMATION_OWNER_REGEX, information)
-        owner = owner_match[0] if owner_match else None
-        matches = re.finditer(self.INFORMATION_COLUMNS_REGEX, information)
+        owner: Optional[str] = None
+        raw_stats: Optional[str] = None
+        columns = []
+        for match in self.INFORMATION_REGEX.finditer(information):
+            kind = match.lastgroup
+            if kind == "column_type":
+                # Types and owners repeat across columns and tables, so share one copy of each
+                column_type = sys.intern(DatabricksColumn.translate_type(match["column_type"]))
+                columns.append((match["column_name"], column_type))
+            elif kind == "owner":
+                owner = owner if owner is not None else sys.intern(match["owner"])
+            elif kind == "stats":
+                raw_stats = raw_stats if raw_stats is not None else match["stats"]
+
         comment_match = re.findall(self.INFORMATION_COMMENT_REGEX, information)
         table_comment = comment_match[0] if comment_match else None
-        columns = []
-        stats_match = re.findall(self.INFORMATION_STATISTICS_REGEX, information)
-        raw_table_stats = stats_match[0] if stats_match else None
-        table_stats = DatabricksColumn.convert_table_stats(raw_table_stats)
+        table_stats = DatabricksColumn.convert_table_stats(raw_stats)
 
-        for match_num, match in enumerate(matches):
-            column_name, column_type, _ = match.groups()
-            column = DatabricksColumn(
+        return [
+            DatabricksColumn(
                 table_database=relation.database,
                 table_schema=relation.schema,
                 table_name=relation.table,
@@ -457,11 +485,11 @@ class DatabricksAdapter(SparkAdapter):
                 column_index=match_num,
                 table_owner=owner,
                 column=column_name,
-                dtype=DatabricksColumn.translate_type(column_type),
+                dtype=column_type,
                 table_stats=table_stats,
             )
-            columns.append(column)
-        return columns
+            for match_num, (column_name, column_type) in enumerate(columns)
+        ]
 
     def get_catalog_by_relations(
         self, used_schemas: FrozenSet[Tuple[str, str]], relations: Set[BaseRelation]
@@ -651,12 +679,13 @@ class DatabricksAdapter(SparkAdapter):
         # an error when we tried to alter the table.
         for column in existing_columns:
             name = column.column
+            model_column = columns.get(name)
             if (
-                name in columns
-                and "description" in columns[name]
-                and columns[name]["description"] != (column.comment or "")
+                model_column is not None
+                and "description" in model_column
+                and model_column["description"] != (column.comment or "")
             ):
-                return_columns[name] = columns[name]
+                return_columns[name] = model_column
 
         return return_columns
 
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from dataclasses import field
+from functools import lru_cache
 from typing import Any
 from typing import Dict
 from typing import Iterable
@@ -13,6 +14,7 @@ from dbt.adapters.base.relation import Policy
 from dbt.adapters.contracts.relation import (
     ComponentName,
 )
+from dbt.adapters.contracts.relation import RelationType
 from dbt.adapters.databricks.utils import remove_undefined
 from dbt.adapters.spark.impl import KEY_TABLE_OWNER
 from dbt.adapters.spark.impl import KEY_TABLE_STATISTICS
@@ -77,6 +79,34 @@ class DatabricksRelation(BaseRelation):
             data["path"]["database"] = remove_undefined(data["path"]["database"])
         return data
 
+    @classmethod
+    def create(
+        cls,
+        database: Optional[str] = None,
+        schema: Optional[str] = None,
+        identifier: Optional[str] = None,
+        type: Optional[RelationType] = None,
+        **kwargs: Any,
+    ) -> "DatabricksRelation":
+        # Relations are frozen, so ones built from plain names can be shared. Anything else,
+        # e.g. jinja's Undefined or extra fields, takes the regular path.
+        if not kwargs and all(
+            part is None or isinstance(part, str) for part in (database, schema, identifier, type)
+        ):
+            return cls._create_cached(database, schema, identifier, type)
+        return super().create(database, schema, identifier, type, **kwargs)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _create_cached(
+        cls,
+        database: Optional[str],
+        schema: Optional[str],
+        identifier: Optional[str],
+        type: Optional[RelationType],
+    ) -> "DatabricksRelation":
+        return super().create(database, schema, identifier, type)
+
     def has_information(self) -> bool:
         return self.metadata is not None
 
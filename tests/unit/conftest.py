@@ -0,0 +1,8 @@
+import dbt.flags as flags
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def disable_strict_mode():
+    flags.STRICT_MODE = False
+    yield
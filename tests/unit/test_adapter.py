@@ -1,9 +1,13 @@
+import re
+from functools import lru_cache
 from multiprocessing import get_context
+from types import MappingProxyType
 from typing import Any
+from typing import cast
 from typing import Dict
+from typing import Mapping
 from typing import Optional
 
-import dbt.flags as flags
 import mock
 import pytest
 from agate import Row
@@ -11,7 +15,9 @@ from dbt.adapters.databricks import __version__
 from dbt.adapters.databricks import DatabricksAdapter
 from dbt.adapters.databricks import DatabricksRelation
 from dbt.adapters.databricks.column import DatabricksColumn
+from dbt.adapters.databricks.connections import DatabricksConnectionManager
 from dbt.adapters.databricks.credentials import CATALOG_KEY_IN_SESSION_PROPERTIES
+from dbt.adapters.databricks.credentials import DatabricksCredentials
 from dbt.adapters.databricks.credentials import DBT_DATABRICKS_HTTP_SESSION_HEADERS
 from dbt.adapters.databricks.credentials import DBT_DATABRICKS_INVOCATION_ENV
 from dbt.adapters.databricks.impl import check_not_found_error
@@ -23,57 +29,367 @@ from dbt_common.exceptions import DbtValidationError
 from mock import Mock
 from tests.unit.utils import config_from_parts_or_dicts
 
+# Mimics the output of Spark with a DESCRIBE TABLE EXTENDED
+_DESCRIBE_KEYS = ("col_name", "data_type", "comment")
+
+_DESCRIBE_ROWS = [
+    Row(keys=_DESCRIBE_KEYS, values=r)
+    for r in [
+        ("col1", "decimal(22,0)", "comment"),
+        ("col2", "string", "comment"),
+        ("dt", "date", None),
+        ("struct_col", "struct<struct_inner_col:string>", None),
+        ("# Partition Information", "data_type", None),
+        ("# col_name", "data_type", "comment"),
+        ("dt", "date", None),
+        (None, None, None),
+        ("# Detailed Table Information", None),
+        ("Database", None),
+        ("Owner", "root", None),
+        ("Created Time", "Wed Feb 04 18:15:00 UTC 1815", None),
+        ("Last Access", "Wed May 20 19:25:00 UTC 1925", None),
+        ("Type", "MANAGED", None),
+        ("Provider", "delta", None),
+        ("Location", "/mnt/vo", None),
+        (
+            "Serde Library",
+            "org.apache.hadoop.hive.serde2.lazy.LazySimpleSerDe",
+            None,
+        ),
+        ("InputFormat", "org.apache.hadoop.mapred.SequenceFileInputFormat", None),
+        (
+            "OutputFormat",
+            "org.apache.hadoop.hive.ql.io.HiveSequenceFileOutputFormat",
+            None,
+        ),
+        ("Partition Provider", "Catalog", None),
+    ]
+]
+
+
+_DESCRIBE_ROWS_INT_OWNER = [
+    Row(keys=_DESCRIBE_KEYS, values=r)
+    for r in [
+        ("col1", "decimal(22,0)", "comment"),
+        ("# Detailed Table Information", None, None),
+        ("Owner", 1234, None),
+    ]
+]
+
+
+_DESCRIBE_ROWS_STATS = [
+    Row(keys=_DESCRIBE_KEYS, values=r)
+    for r in [
+        ("col1", "decimal(22,0)", "comment"),
+        ("# Partition Information", "data_type", None),
+        (None, None, None),
+        ("# Detailed Table Information", None, None),
+        ("Database", None, None),
+        ("Owner", "root", None),
+        ("Created Time", "Wed Feb 04 18:15:00 UTC 1815", None),
+        ("Last Access", "Wed May 20 19:25:00 UTC 1925", None),
+        ("Comment", "Table model description", None),
+        ("Statistics", "1109049927 bytes, 14093476 rows", None),
+        ("Type", "MANAGED", None),
+        ("Provider", "delta", None),
+        ("Location", "/mnt/vo", None),
+        (
+            "Serde Library",
+            "org.apache.hadoop.hive.serde2.lazy.LazySimpleSerDe",
+            None,
+        ),
+        ("InputFormat", "org.apache.hadoop.mapred.SequenceFileInputFormat", None),
+        (
+            "OutputFormat",
+            "org.apache.hadoop.hive.ql.io.HiveSequenceFileOutputFormat",
+            None,
+        ),
+        ("Partition Provider", "Catalog", None),
+    ]
+]
+
+
+# Mimics the output of Spark in the information column
+_TABLE_INFO = (
+    "Database: default_schema\n"
+    "Table: mytable\n"
+    "Owner: root\n"
+    "Created Time: Wed Feb 04 18:15:00 UTC 1815\n"
+    "Last Access: Wed May 20 19:25:00 UTC 1925\n"
+    "Created By: Spark 3.0.1\n"
+    "Type: MANAGED\n"
+    "Provider: delta\n"
+    "Statistics: 123456789 bytes\n"
+    "Location: /mnt/vo\n"
+    "Serde Library: org.apache.hadoop.hive.serde2.lazy.LazySimpleSerDe\n"
+    "InputFormat: org.apache.hadoop.mapred.SequenceFileInputFormat\n"
+    "OutputFormat: org.apache.hadoop.hive.ql.io.HiveSequenceFileOutputFormat\n"
+    "Partition Provider: Catalog\n"
+    "Partition Columns: [`dt`]\n"
+    "Schema: root\n"
+    " |-- col1: decimal(22,0) (nullable = true)\n"
+    " |-- col2: string (nullable = true)\n"
+    " |-- dt: date (nullable = true)\n"
+    " |-- struct_col: struct (nullable = true)\n"
+    " |    |-- struct_inner_col: string (nullable = true)\n"
+)
+
+_VIEW_INFO = (
+    "Database: default_schema\n"
+    "Table: myview\n"
+    "Owner: root\n"
+    "Created Time: Wed Feb 04 18:15:00 UTC 1815\n"
+    "Last Access: UNKNOWN\n"
+    "Created By: Spark 3.0.1\n"
+    "Type: VIEW\n"
+    "View Text: WITH base (\n"
+    "    SELECT * FROM source_table\n"
+    ")\n"
+    "SELECT col1, col2, dt FROM base\n"
+    "View Original Text: WITH base (\n"
+    "    SELECT * FROM source_table\n"
+    ")\n"
+    "SELECT col1, col2, dt FROM base\n"
+    "View Catalog and Namespace: spark_catalog.default\n"
+    "View Query Output Columns: [col1, col2, dt]\n"
+    "Table Properties: [view.query.out.col.1=col1, view.query.out.col.2=col2, "
+    "transient_lastDdlTime=1618324324, view.query.out.col.3=dt, "
+    "view.catalogAndNamespace.part.0=spark_catalog, "
+    "view.catalogAndNamespace.part.1=default]\n"
+    "Serde Library: org.apache.hadoop.hive.serde2.lazy.LazySimpleSerDe\n"
+    "InputFormat: org.apache.hadoop.mapred.SequenceFileInputFormat\n"
+    "OutputFormat: org.apache.hadoop.hive.ql.io.HiveSequenceFileOutputFormat\n"
+    "Storage Properties: [serialization.format=1]\n"
+    "Schema: root\n"
+    " |-- col1: decimal(22,0) (nullable = true)\n"
+    " |-- col2: string (nullable = true)\n"
+    " |-- dt: date (nullable = true)\n"
+    " |-- struct_col: struct (nullable = true)\n"
+    " |    |-- struct_inner_col: string (nullable = true)\n"
+)
+
+_PARQUET_TABLE_INFO = (
+    "Database: default_schema\n"
+    "Table: mytable\n"
+    "Owner: root\n"
+    "Created Time: Wed Feb 04 18:15:00 UTC 1815\n"
+    "Last Access: Wed May 20 19:25:00 UTC 1925\n"
+    "Created By: Spark 3.0.1\n"
+    "Type: MANAGED\n"
+    "Provider: parquet\n"
+    "Statistics: 1234567890 bytes, 12345678 rows\n"
+    "Location: /mnt/vo\n"
+    "Serde Library: org.apache.hadoop.hive.ql.io.parquet.serde.ParquetHiveSerDe\n"
+    "InputFormat: org.apache.hadoop.hive.ql.io.parquet.MapredParquetInputFormat\n"
+    "OutputFormat: org.apache.hadoop.hive.ql.io.parquet.MapredParquetOutputFormat\n"
+    "Schema: root\n"
+    " |-- col1: decimal(22,0) (nullable = true)\n"
+    " |-- col2: string (nullable = true)\n"
+    " |-- dt: date (nullable = true)\n"
+    " |-- struct_col: struct (nullable = true)\n"
+    " |    |-- struct_inner_col: string (nullable = true)\n"
+)
+
+
+# Column attributes that are the same for every column parsed in these tests
+_BASE_COLS = {
+    "table_database": None,
+    "table_owner": "root",
+    "table_comment": None,
+    "numeric_scale": None,
+    "numeric_precision": None,
+    "char_size": None,
+}
+
+
+# Expected http headers, as (name, value) pairs passed to dbsql.connect
+_HDR_TEST_JOB = ("test", '{"jobId": 1, "runId": 12123}')
+_HDR_DUMMY_JOB = ("dummy", '{"jobId": 1, "runId": 12123}')
+_HDR_T_JOB = ("t", '{"jobId": 1, "runId": 12123}')
+_HDR_D_JOB = ("d", '{"jobId": 1, "runId": 12123}')
+_HDR_NOTHING = ("nothing", "nothing")
+_HDR_STRING = ("string", "some-string")
+_HDR_AAA = ("aaa", "xxx")
+_HDR_BBB = ("bbb", "yyy")
+
+
+# Expected default user agent entry passed to dbsql.connect
+_UA_DEFAULT = f"dbt-databricks/{__version__.version}"
+
+
+# Expected error messages, matched with pytest.raises(match=...)
+_RE_TWO_CATALOG = re.compile(
+    re.escape(
+        'Got duplicate keys: (`databricks.catalog` in session_properties) all map to "database"'
+    )
+)
+_RE_DATABASE_AND_CATALOG = re.compile(
+    re.escape('Got duplicate keys: (catalog) all map to "database"')
+)
+_RE_RESERVED_PARAMETER = re.compile(
+    re.escape("The connection parameter `server_hostname` is reserved.")
+)
+_RE_INVALID_HTTP_HEADERS = re.compile(
+    re.escape("The connection parameter `http_headers` should be dict of strings")
+)
+_RE_INVALID_INVOCATION_ENV = re.compile("Invalid invocation environment")
+_RE_HTTP_HEADERS_INTERSECTION = re.compile(
+    re.escape("Intersection with reserved http_headers in keys: {'t'}")
+)
+
+
+_BASE_PROJECT_CFG: Mapping[str, Any] = MappingProxyType(
+    {
+        "name": "X",
+        "version": "0.1",
+        "profile": "test",
+        "project-root": "/tmp/dbt/does-not-exist",
+        "quoting": {
+            "identifier": False,
+            "schema": False,
+        },
+        "config-version": 2,
+    }
+)
+
+_BASE_PROFILE_CFG: Mapping[str, Any] = MappingProxyType(
+    {
+        "outputs": {
+            "test": {
+                "type": "databricks",
+                "catalog": "main",
+                "schema": "analytics",
+                "host": "yourorg.databricks.com",
+                "http_path": "sql/protocolv1/o/1234567890123456/1234-567890-test123",
+            }
+        },
+        "target": "test",
+    }
+)
+
+_DEFAULT_TOKEN = "dapiXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX"
+_DEFAULT_SESSION_PROPERTIES = {"spark.sql.ansi.enabled": "true"}
+
+
+def _build_config(
+    token: Optional[str], session_properties: Optional[Dict[str, str]], **kwargs: Any
+) -> RuntimeConfig:
+    """Builds a RuntimeConfig from the base project and profile with the given target overrides."""
+    target = dict(_BASE_PROFILE_CFG["outputs"]["test"])
+    if token:
+        target["token"] = token
+    if session_properties:
+        target["session_properties"] = session_properties
+
+    target.update(kwargs)
+
+    # config_from_parts_or_dicts deep-copies both dicts, so the base ones are never mutated
+    profile_cfg = {**_BASE_PROFILE_CFG, "outputs": {"test": target}}
+    return config_from_parts_or_dicts(dict(_BASE_PROJECT_CFG), profile_cfg)
+
+
+@lru_cache(maxsize=None)
+def _default_config() -> RuntimeConfig:
+    """The RuntimeConfig for the default target, parsed once per session."""
+    return _build_config(_DEFAULT_TOKEN, _DEFAULT_SESSION_PROPERTIES)
+
+
+class _StubConnection:
+    """The smallest stand-in for a connector Connection that the adapter will accept."""
+
+    def get_session_id_hex(self) -> str:
+        return "stub-session"
+
+    def close(self) -> None:
+        pass
+
+
+_STUB_CONNECTION = _StubConnection()
+
+
+@lru_cache(maxsize=None)
+def _connect_func(
+    *,
+    expected_catalog="main",
+    expected_invocation_env=None,
+    expected_http_headers=None,
+    expected_no_token=None,
+    expected_client_creds=None,
+):
+    """Returns a stand-in for `dbsql.connect` that checks the arguments it is called with.
+
+    `expected_http_headers` must be a tuple so the result can be cached.
+    """
+    expected_user_agent_entry = _UA_DEFAULT
+    if expected_invocation_env is not None:
+        expected_user_agent_entry = f"{_UA_DEFAULT}; {expected_invocation_env}"
+
+    def connect(
+        server_hostname,
+        http_path,
+        credentials_provider,
+        http_headers,
+        session_configuration,
+        catalog,
+        _user_agent_entry,
+        **kwargs,
+    ):
+        assert server_hostname == "yourorg.databricks.com"
+        assert http_path == "sql/protocolv1/o/1234567890123456/1234-567890-test123"
+        if not (expected_no_token or expected_client_creds):
+            assert credentials_provider._token == "dapiXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX"
+
+        if expected_client_creds:
+            assert kwargs.get("client_id") == "foo"
+            assert kwargs.get("client_secret") == "bar"
+        assert session_configuration["spark.sql.ansi.enabled"] == "true"
+        if expected_catalog is None:
+            assert catalog is None
+        else:
+            assert catalog == expected_catalog
+        assert _user_agent_entry == expected_user_agent_entry
+        if expected_http_headers is None:
+            assert http_headers is None
+        else:
+            assert http_headers == list(expected_http_headers)
 
-class DatabricksAdapterBase:
-    @pytest.fixture(autouse=True)
-    def setUp(self):
-        flags.STRICT_MODE = False
-
-        self.project_cfg = {
-            "name": "X",
-            "version": "0.1",
-            "profile": "test",
-            "project-root": "/tmp/dbt/does-not-exist",
-            "quoting": {
-                "identifier": False,
-                "schema": False,
-            },
-            "config-version": 2,
-        }
+        return _STUB_CONNECTION
+
+    return connect
 
-        self.profile_cfg = {
-            "outputs": {
-                "test": {
-                    "type": "databricks",
-                    "catalog": "main",
-                    "schema": "analytics",
-                    "host": "yourorg.databricks.com",
-                    "http_path": "sql/protocolv1/o/1234567890123456/1234-567890-test123",
-                }
-            },
-            "target": "test",
-        }
 
+@pytest.fixture(scope="class")
+def base_config() -> RuntimeConfig:
+    """The default RuntimeConfig, parsed once and shared by every test."""
+    return _default_config()
+
+
+@pytest.fixture(scope="class")
+def adapter(base_config) -> DatabricksAdapter:
+    """A shared adapter for tests that only parse, and never open a connection."""
+    return DatabricksAdapter(base_config, get_context("spawn"))
+
+
+class DatabricksAdapterBase:
     def _get_config(
         self,
-        token: Optional[str] = "dapiXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX",
-        session_properties: Optional[Dict[str, str]] = {"spark.sql.ansi.enabled": "true"},
+        token: Optional[str] = _DEFAULT_TOKEN,
+        session_properties: Optional[Dict[str, str]] = _DEFAULT_SESSION_PROPERTIES,
         **kwargs: Any,
     ) -> RuntimeConfig:
-        if token:
-            self.profile_cfg["outputs"]["test"]["token"] = token
-        if session_properties:
-            self.profile_cfg["outputs"]["test"]["session_properties"] = session_properties
-
-        for key, val in kwargs.items():
-            self.profile_cfg["outputs"]["test"][key] = val
+        if (
+            not kwargs
+            and token == _DEFAULT_TOKEN
+            and session_properties == _DEFAULT_SESSION_PROPERTIES
+        ):
+            return _default_config()
 
-        return config_from_parts_or_dicts(self.project_cfg, self.profile_cfg)
+        return _build_config(token, session_properties, **kwargs)
 
 
 class TestDatabricksAdapter(DatabricksAdapterBase):
     def test_two_catalog_settings(self):
-        with pytest.raises(DbtConfigError) as excinfo:
+        with pytest.raises(DbtConfigError, match=_RE_TWO_CATALOG):
             self._get_config(
                 session_properties={
                     CATALOG_KEY_IN_SESSION_PROPERTIES: "catalog",
@@ -81,267 +397,142 @@ class TestDatabricksAdapter(DatabricksAdapterBase):
                 }
             )
 
-        expected_message = (
-            "Got duplicate keys: (`databricks.catalog` in session_properties)"
-            ' all map to "database"'
-        )
-
-        assert expected_message in str(excinfo.value)
-
     def test_database_and_catalog_settings(self):
-        with pytest.raises(DbtConfigError) as excinfo:
+        with pytest.raises(DbtConfigError, match=_RE_DATABASE_AND_CATALOG):
             self._get_config(catalog="main", database="database")
 
-        assert 'Got duplicate keys: (catalog) all map to "database"' in str(excinfo.value)
-
     def test_reserved_connection_parameters(self):
-        with pytest.raises(DbtConfigError) as excinfo:
+        with pytest.raises(DbtConfigError, match=_RE_RESERVED_PARAMETER):
             self._get_config(connection_parameters={"server_hostname": "theirorg.databricks.com"})
 
-        assert "The connection parameter `server_hostname` is reserved." in str(excinfo.value)
-
-    def test_invalid_http_headers(self):
-        def test_http_headers(http_header):
-            with pytest.raises(DbtConfigError) as excinfo:
-                self._get_config(connection_parameters={"http_headers": http_header})
-
-            assert "The connection parameter `http_headers` should be dict of strings" in str(
-                excinfo.value
-            )
-
-        test_http_headers("a")
-        test_http_headers(["a", "b"])
-        test_http_headers({"a": 1, "b": 2})
-
-    def test_invalid_custom_user_agent(self):
-        with pytest.raises(DbtValidationError) as excinfo:
-            config = self._get_config()
-            adapter = DatabricksAdapter(config, get_context("spawn"))
-            with mock.patch.dict("os.environ", **{DBT_DATABRICKS_INVOCATION_ENV: "(Some-thing)"}):
-                connection = adapter.acquire_connection("dummy")
-                connection.handle  # trigger lazy-load
-
-        assert "Invalid invocation environment" in str(excinfo.value)
-
-    def test_custom_user_agent(self):
-        config = self._get_config()
-        adapter = DatabricksAdapter(config, get_context("spawn"))
-
-        with mock.patch(
-            "dbt.adapters.databricks.connections.dbsql.connect",
-            new=self._connect_func(expected_invocation_env="databricks-workflows"),
-        ):
-            with mock.patch.dict(
-                "os.environ", **{DBT_DATABRICKS_INVOCATION_ENV: "databricks-workflows"}
-            ):
-                connection = adapter.acquire_connection("dummy")
-                connection.handle  # trigger lazy-load
-
-    def test_environment_single_http_header(self):
-        self._test_environment_http_headers(
-            http_headers_str='{"test":{"jobId":1,"runId":12123}}',
-            expected_http_headers=[("test", '{"jobId": 1, "runId": 12123}')],
-        )
-
-    def test_environment_multiple_http_headers(self):
-        self._test_environment_http_headers(
-            http_headers_str='{"test":{"jobId":1,"runId":12123},"dummy":{"jobId":1,"runId":12123}}',
-            expected_http_headers=[
-                ("test", '{"jobId": 1, "runId": 12123}'),
-                ("dummy", '{"jobId": 1, "runId": 12123}'),
-            ],
-        )
-
-    def test_environment_users_http_headers_intersection_error(self):
-        with pytest.raises(DbtValidationError) as excinfo:
-            self._test_environment_http_headers(
-                http_headers_str='{"t":{"jobId":1,"runId":12123},"d":{"jobId":1,"runId":12123}}',
-                expected_http_headers=[],
-                user_http_headers={"t": "test", "nothing": "nothing"},
-            )
-
-        assert "Intersection with reserved http_headers in keys: {'t'}" in str(excinfo.value)
-
-    def test_environment_users_http_headers_union_success(self):
-        self._test_environment_http_headers(
-            http_headers_str='{"t":{"jobId":1,"runId":12123},"d":{"jobId":1,"runId":12123}}',
-            user_http_headers={"nothing": "nothing"},
-            expected_http_headers=[
-                ("t", '{"jobId": 1, "runId": 12123}'),
-                ("d", '{"jobId": 1, "runId": 12123}'),
-                ("nothing", "nothing"),
-            ],
+    @pytest.mark.parametrize("bad_header", ["a", ["a", "b"], {"a": 1, "b": 2}])
+    def test_invalid_http_headers(self, bad_header):
+        with pytest.raises(DbtConfigError, match=_RE_INVALID_HTTP_HEADERS):
+            self._get_config(connection_parameters={"http_headers": bad_header})
+
+    def test_invalid_custom_user_agent(self, monkeypatch):
+        monkeypatch.setenv(DBT_DATABRICKS_INVOCATION_ENV, "(Some-thing)")
+        with pytest.raises(DbtValidationError, match=_RE_INVALID_INVOCATION_ENV):
+            self._get_connect_kwargs(self._get_config())
+
+    def test_custom_user_agent(self, monkeypatch):
+        monkeypatch.setenv(DBT_DATABRICKS_INVOCATION_ENV, "databricks-workflows")
+        connect = _connect_func(expected_invocation_env="databricks-workflows")
+        connect(**self._get_connect_kwargs(self._get_config()))
+
+    @pytest.mark.parametrize(
+        "http_headers_str, user_http_headers, expected_http_headers",
+        [
+            ('{"test":{"jobId":1,"runId":12123}}', None, (_HDR_TEST_JOB,)),
+            (
+                '{"test":{"jobId":1,"runId":12123},"dummy":{"jobId":1,"runId":12123}}',
+                None,
+                (_HDR_TEST_JOB, _HDR_DUMMY_JOB),
+            ),
+            (
+                '{"t":{"jobId":1,"runId":12123},"d":{"jobId":1,"runId":12123}}',
+                {"nothing": "nothing"},
+                (_HDR_T_JOB, _HDR_D_JOB, _HDR_NOTHING),
+            ),
+            ('{"string":"some-string"}', None, (_HDR_STRING,)),
+        ],
+        ids=["single", "multiple", "users_union", "string"],
+    )
+    def test_environment_http_headers(
+        self, http_headers_str, user_http_headers, expected_http_headers, monkeypatch
+    ):
+        monkeypatch.setenv(DBT_DATABRICKS_HTTP_SESSION_HEADERS, http_headers_str)
+        http_headers = DatabricksCredentials.get_all_http_headers(user_http_headers or {})
+        assert list(http_headers.items()) == list(expected_http_headers)
+
+    def test_environment_http_headers_connect(self, monkeypatch):
+        monkeypatch.setenv(
+            DBT_DATABRICKS_HTTP_SESSION_HEADERS,
+            '{"t":{"jobId":1,"runId":12123},"d":{"jobId":1,"runId":12123}}',
         )
-
-    def test_environment_http_headers_string(self):
-        self._test_environment_http_headers(
-            http_headers_str='{"string":"some-string"}',
-            expected_http_headers=[("string", "some-string")],
+        config = self._get_config(connection_parameters={"http_headers": {"nothing": "nothing"}})
+        connect = _connect_func(expected_http_headers=(_HDR_T_JOB, _HDR_D_JOB, _HDR_NOTHING))
+        connect(**self._get_connect_kwargs(config))
+
+    def test_environment_users_http_headers_intersection_error(self, monkeypatch):
+        monkeypatch.setenv(
+            DBT_DATABRICKS_HTTP_SESSION_HEADERS,
+            '{"t":{"jobId":1,"runId":12123},"d":{"jobId":1,"runId":12123}}',
         )
-
-    def _test_environment_http_headers(
-        self, http_headers_str, expected_http_headers, user_http_headers=None
-    ):
-        if user_http_headers:
-            config = self._get_config(connection_parameters={"http_headers": user_http_headers})
-        else:
-            config = self._get_config()
-
-        adapter = DatabricksAdapter(config, get_context("spawn"))
-
-        with mock.patch(
-            "dbt.adapters.databricks.connections.dbsql.connect",
-            new=self._connect_func(expected_http_headers=expected_http_headers),
-        ):
-            with mock.patch.dict(
-                "os.environ",
-                **{DBT_DATABRICKS_HTTP_SESSION_HEADERS: http_headers_str},
-            ):
-                connection = adapter.acquire_connection("dummy")
-                connection.handle  # trigger lazy-load
+        with pytest.raises(DbtValidationError, match=_RE_HTTP_HEADERS_INTERSECTION):
+            DatabricksCredentials.get_all_http_headers({"t": "test", "nothing": "nothing"})
 
     @pytest.mark.skip("not ready")
-    def test_oauth_settings(self):
+    @pytest.mark.parametrize("patched_dbsql_connect", [{"expected_no_token": True}], indirect=True)
+    def test_oauth_settings(self, patched_dbsql_connect):
         config = self._get_config(token=None)
 
         adapter = DatabricksAdapter(config, get_context("spawn"))
 
-        with mock.patch(
-            "dbt.adapters.databricks.connections.dbsql.connect",
-            new=self._connect_func(expected_no_token=True),
-        ):
-            connection = adapter.acquire_connection("dummy")
-            connection.handle  # trigger lazy-load
+        connection = adapter.acquire_connection("dummy")
+        connection.handle  # trigger lazy-load
 
     @pytest.mark.skip("not ready")
-    def test_client_creds_settings(self):
+    @pytest.mark.parametrize(
+        "patched_dbsql_connect", [{"expected_client_creds": True}], indirect=True
+    )
+    def test_client_creds_settings(self, patched_dbsql_connect):
         config = self._get_config(client_id="foo", client_secret="bar")
 
         adapter = DatabricksAdapter(config, get_context("spawn"))
 
+        connection = adapter.acquire_connection("dummy")
+        connection.handle  # trigger lazy-load
+
+    @pytest.fixture
+    def patched_dbsql_connect(self, request):
+        """Patches `dbsql.connect` with `_connect_func`, configured by the indirect param."""
         with mock.patch(
             "dbt.adapters.databricks.connections.dbsql.connect",
-            new=self._connect_func(expected_client_creds=True),
+            new=_connect_func(**getattr(request, "param", {})),
         ):
-            connection = adapter.acquire_connection("dummy")
-            connection.handle  # trigger lazy-load
+            yield
 
-    def _connect_func(
-        self,
-        *,
-        expected_catalog="main",
-        expected_invocation_env=None,
-        expected_http_headers=None,
-        expected_no_token=None,
-        expected_client_creds=None,
-    ):
-        def connect(
-            server_hostname,
-            http_path,
-            credentials_provider,
-            http_headers,
-            session_configuration,
-            catalog,
-            _user_agent_entry,
-            **kwargs,
-        ):
-            assert server_hostname == "yourorg.databricks.com"
-            assert http_path == "sql/protocolv1/o/1234567890123456/1234-567890-test123"
-            if not (expected_no_token or expected_client_creds):
-                assert credentials_provider._token == "dapiXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX"
-
-            if expected_client_creds:
-                assert kwargs.get("client_id") == "foo"
-                assert kwargs.get("client_secret") == "bar"
-            assert session_configuration["spark.sql.ansi.enabled"] == "true"
-            if expected_catalog is None:
-                assert catalog is None
-            else:
-                assert catalog == expected_catalog
-            if expected_invocation_env is not None:
-                assert (
-                    _user_agent_entry
-                    == f"dbt-databricks/{__version__.version}; {expected_invocation_env}"
-                )
-            else:
-                assert _user_agent_entry == f"dbt-databricks/{__version__.version}"
-            if expected_http_headers is None:
-                assert http_headers is None
-            else:
-                assert http_headers == expected_http_headers
-
-        return connect
-
-    def test_databricks_sql_connector_connection(self):
-        self._test_databricks_sql_connector_connection(self._connect_func())
-
-    def _test_databricks_sql_connector_connection(self, connect):
-        config = self._get_config()
-        adapter = DatabricksAdapter(config, get_context("spawn"))
-
-        with mock.patch("dbt.adapters.databricks.connections.dbsql.connect", new=connect):
-            connection = adapter.acquire_connection("dummy")
-            connection.handle  # trigger lazy-load
-
-            assert connection.state == "open"
-            assert connection.handle
-            assert (
-                connection.credentials.http_path
-                == "sql/protocolv1/o/1234567890123456/1234-567890-test123"
-            )
-            assert connection.credentials.token == "dapiXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX"
-            assert connection.credentials.schema == "analytics"
-            assert len(connection.credentials.session_properties) == 1
-            assert connection.credentials.session_properties["spark.sql.ansi.enabled"] == "true"
-
-    def test_databricks_sql_connector_catalog_connection(self):
-        self._test_databricks_sql_connector_catalog_connection(
-            self._connect_func(expected_catalog="main")
-        )
+    def _get_connect_kwargs(self, config: RuntimeConfig) -> Dict[str, Any]:
+        """Builds the `dbsql.connect` kwargs without opening a connection."""
+        creds = cast(DatabricksCredentials, config.credentials)
+        kwargs = DatabricksConnectionManager._get_connect_kwargs(creds, creds.http_path)
+        # `open` authenticates first; do the same here without touching the class-level provider
+        kwargs["credentials_provider"] = creds.authenticate(None)
+        return kwargs
 
-    def _test_databricks_sql_connector_catalog_connection(self, connect):
+    def test_databricks_sql_connector_connection(self, patched_dbsql_connect):
         config = self._get_config()
         adapter = DatabricksAdapter(config, get_context("spawn"))
 
-        with mock.patch("dbt.adapters.databricks.connections.dbsql.connect", new=connect):
-            connection = adapter.acquire_connection("dummy")
-            connection.handle  # trigger lazy-load
-
-            assert connection.state == "open"
-            assert connection.handle
-            assert (
-                connection.credentials.http_path
-                == "sql/protocolv1/o/1234567890123456/1234-567890-test123"
-            )
-            assert connection.credentials.token == "dapiXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX"
-            assert connection.credentials.schema == "analytics"
-            assert connection.credentials.database == "main"
-
-    def test_databricks_sql_connector_http_header_connection(self):
-        self._test_databricks_sql_connector_http_header_connection(
-            {"aaa": "xxx"}, self._connect_func(expected_http_headers=[("aaa", "xxx")])
-        )
-        self._test_databricks_sql_connector_http_header_connection(
-            {"aaa": "xxx", "bbb": "yyy"},
-            self._connect_func(expected_http_headers=[("aaa", "xxx"), ("bbb", "yyy")]),
-        )
-
-    def _test_databricks_sql_connector_http_header_connection(self, http_headers, connect):
+        connection = adapter.acquire_connection("dummy")
+        connection.handle  # trigger lazy-load
+
+        assert connection.state == "open"
+        assert connection.handle
+        self._assert_default_credentials(connection.credentials)
+
+    @pytest.mark.parametrize(
+        "http_headers, expected_http_headers",
+        [
+            ({"aaa": "xxx"}, (_HDR_AAA,)),
+            ({"aaa": "xxx", "bbb": "yyy"}, (_HDR_AAA, _HDR_BBB)),
+        ],
+    )
+    def test_databricks_sql_connector_http_headers(self, http_headers, expected_http_headers):
         config = self._get_config(connection_parameters={"http_headers": http_headers})
-        adapter = DatabricksAdapter(config, get_context("spawn"))
 
-        with mock.patch("dbt.adapters.databricks.connections.dbsql.connect", new=connect):
-            connection = adapter.acquire_connection("dummy")
-            connection.handle  # trigger lazy-load
+        connect = _connect_func(expected_http_headers=expected_http_headers)
+        connect(**self._get_connect_kwargs(config))
+        self._assert_default_credentials(config.credentials)
 
-            assert connection.state == "open"
-            assert connection.handle
-            assert (
-                connection.credentials.http_path
-                == "sql/protocolv1/o/1234567890123456/1234-567890-test123"
-            )
-            assert connection.credentials.token == "dapiXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX"
-            assert connection.credentials.schema == "analytics"
+    def _assert_default_credentials(self, credentials):
+        assert credentials.http_path == "sql/protocolv1/o/1234567890123456/1234-567890-test123"
+        assert credentials.token == "dapiXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX"
+        assert credentials.schema == "analytics"
+        assert credentials.database == "main"
+        assert len(credentials.session_properties) == 1
+        assert credentials.session_properties["spark.sql.ansi.enabled"] == "true"
 
     def test_list_relations_without_caching__no_relations(self):
         with mock.patch.object(DatabricksAdapter, "get_relations_without_caching") as mocked:
@@ -399,7 +590,6 @@ class TestDatabricksAdapter(DatabricksAdapterBase):
                 assert table.column_names == ("name", "type", "comment")
 
     def test_simple_catalog_relation(self):
-        self.maxDiff = None
         rel_type = DatabricksRelation.get_relation_type.Table
 
         relation = DatabricksRelation.create(
@@ -410,8 +600,7 @@ class TestDatabricksAdapter(DatabricksAdapterBase):
         )
         assert relation.database == "test_catalog"
 
-    def test_parse_relation(self):
-        self.maxDiff = None
+    def test_parse_relation(self, adapter):
         rel_type = DatabricksRelation.get_relation_type.Table
 
         relation = DatabricksRelation.create(
@@ -419,44 +608,7 @@ class TestDatabricksAdapter(DatabricksAdapterBase):
         )
         assert relation.database is None
 
-        # Mimics the output of Spark with a DESCRIBE TABLE EXTENDED
-        plain_rows = [
-            ("col1", "decimal(22,0)", "comment"),
-            ("col2", "string", "comment"),
-            ("dt", "date", None),
-            ("struct_col", "struct<struct_inner_col:string>", None),
-            ("# Partition Information", "data_type", None),
-            ("# col_name", "data_type", "comment"),
-            ("dt", "date", None),
-            (None, None, None),
-            ("# Detailed Table Information", None),
-            ("Database", None),
-            ("Owner", "root", None),
-            ("Created Time", "Wed Feb 04 18:15:00 UTC 1815", None),
-            ("Last Access", "Wed May 20 19:25:00 UTC 1925", None),
-            ("Type", "MANAGED", None),
-            ("Provider", "delta", None),
-            ("Location", "/mnt/vo", None),
-            (
-                "Serde Library",
-                "org.apache.hadoop.hive.serde2.lazy.LazySimpleSerDe",
-                None,
-            ),
-            ("InputFormat", "org.apache.hadoop.mapred.SequenceFileInputFormat", None),
-            (
-                "OutputFormat",
-                "org.apache.hadoop.hive.ql.io.HiveSequenceFileOutputFormat",
-                None,
-            ),
-            ("Partition Provider", "Catalog", None),
-        ]
-
-        input_cols = [Row(keys=["col_name", "data_type", "comment"], values=r) for r in plain_rows]
-
-        config = self._get_config()
-        metadata, rows = DatabricksAdapter(config, get_context("spawn")).parse_describe_extended(
-            relation, input_cols
-        )
+        metadata, rows = adapter.parse_describe_extended(relation, _DESCRIBE_ROWS)
 
         assert metadata == {
             "# col_name": "data_type",
@@ -478,71 +630,50 @@ class TestDatabricksAdapter(DatabricksAdapterBase):
 
         assert len(rows) == 4
         assert rows[0].to_column_dict(omit_none=False) == {
-            "table_database": None,
+            **_BASE_COLS,
             "table_schema": relation.schema,
             "table_name": relation.name,
             "table_type": rel_type,
-            "table_owner": "root",
-            "table_comment": None,
             "column": "col1",
             "column_index": 0,
             "dtype": "decimal(22,0)",
-            "numeric_scale": None,
-            "numeric_precision": None,
-            "char_size": None,
             "comment": "comment",
         }
 
         assert rows[1].to_column_dict(omit_none=False) == {
-            "table_database": None,
+            **_BASE_COLS,
             "table_schema": relation.schema,
             "table_name": relation.name,
             "table_type": rel_type,
-            "table_owner": "root",
-            "table_comment": None,
             "column": "col2",
             "column_index": 1,
             "dtype": "string",
-            "numeric_scale": None,
-            "numeric_precision": None,
-            "char_size": None,
             "comment": "comment",
         }
 
         assert rows[2].to_column_dict(omit_none=False) == {
-            "table_database": None,
+            **_BASE_COLS,
             "table_schema": relation.schema,
             "table_name": relation.name,
             "table_type": rel_type,
-            "table_owner": "root",
-            "table_comment": None,
             "column": "dt",
             "column_index": 2,
             "dtype": "date",
-            "numeric_scale": None,
-            "numeric_precision": None,
-            "char_size": None,
             "comment": None,
         }
 
         assert rows[3].to_column_dict(omit_none=False) == {
-            "table_database": None,
+            **_BASE_COLS,
             "table_schema": relation.schema,
             "table_name": relation.name,
             "table_type": rel_type,
-            "table_owner": "root",
-            "table_comment": None,
             "column": "struct_col",
             "column_index": 3,
             "dtype": "struct<struct_inner_col:string>",
-            "numeric_scale": None,
-            "numeric_precision": None,
-            "char_size": None,
             "comment": None,
         }
 
-    def test_parse_relation_with_integer_owner(self):
-        self.maxDiff = None
+    def test_parse_relation_with_integer_owner(self, adapter):
         rel_type = DatabricksRelation.get_relation_type.Table
 
         relation = DatabricksRelation.create(
@@ -550,24 +681,11 @@ class TestDatabricksAdapter(DatabricksAdapterBase):
         )
         assert relation.database is None
 
-        # Mimics the output of Spark with a DESCRIBE TABLE EXTENDED
-        plain_rows = [
-            ("col1", "decimal(22,0)", "comment"),
-            ("# Detailed Table Information", None, None),
-            ("Owner", 1234, None),
-        ]
-
-        input_cols = [Row(keys=["col_name", "data_type", "comment"], values=r) for r in plain_rows]
-
-        config = self._get_config()
-        _, rows = DatabricksAdapter(config, get_context("spawn")).parse_describe_extended(
-            relation, input_cols
-        )
+        _, rows = adapter.parse_describe_extended(relation, _DESCRIBE_ROWS_INT_OWNER)
 
         assert rows[0].to_column_dict().get("table_owner") == "1234"
 
-    def test_parse_relation_with_statistics(self):
-        self.maxDiff = None
+    def test_parse_relation_with_statistics(self, adapter):
         rel_type = DatabricksRelation.get_relation_type.Table
 
         relation = DatabricksRelation.create(
@@ -575,41 +693,7 @@ class TestDatabricksAdapter(DatabricksAdapterBase):
         )
         assert relation.database is None
 
-        # Mimics the output of Spark with a DESCRIBE TABLE EXTENDED
-        plain_rows = [
-            ("col1", "decimal(22,0)", "comment"),
-            ("# Partition Information", "data_type", None),
-            (None, None, None),
-            ("# Detailed Table Information", None, None),
-            ("Database", None, None),
-            ("Owner", "root", None),
-            ("Created Time", "Wed Feb 04 18:15:00 UTC 1815", None),
-            ("Last Access", "Wed May 20 19:25:00 UTC 1925", None),
-            ("Comment", "Table model description", None),
-            ("Statistics", "1109049927 bytes, 14093476 rows", None),
-            ("Type", "MANAGED", None),
-            ("Provider", "delta", None),
-            ("Location", "/mnt/vo", None),
-            (
-                "Serde Library",
-                "org.apache.hadoop.hive.serde2.lazy.LazySimpleSerDe",
-                None,
-            ),
-            ("InputFormat", "org.apache.hadoop.mapred.SequenceFileInputFormat", None),
-            (
-                "OutputFormat",
-                "org.apache.hadoop.hive.ql.io.HiveSequenceFileOutputFormat",
-                None,
-            ),
-            ("Partition Provider", "Catalog", None),
-        ]
-
-        input_cols = [Row(keys=["col_name", "data_type", "comment"], values=r) for r in plain_rows]
-
-        config = self._get_config()
-        metadata, rows = DatabricksAdapter(config, get_context("spawn")).parse_describe_extended(
-            relation, input_cols
-        )
+        metadata, rows = adapter.parse_describe_extended(relation, _DESCRIBE_ROWS_STATS)
 
         assert metadata == {
             None: None,
@@ -631,19 +715,15 @@ class TestDatabricksAdapter(DatabricksAdapterBase):
 
         assert len(rows) == 1
         assert rows[0].to_column_dict(omit_none=False) == {
-            "table_database": None,
+            **_BASE_COLS,
             "table_schema": relation.schema,
             "table_name": relation.name,
             "table_type": rel_type,
-            "table_owner": "root",
             "table_comment": "Table model description",
             "column": "col1",
             "column_index": 0,
             "comment": "comment",
             "dtype": "decimal(22,0)",
-            "numeric_scale": None,
-            "numeric_precision": None,
-            "char_size": None,
             "stats:bytes:description": "",
             "stats:bytes:include": True,
             "stats:bytes:label": "bytes",
@@ -654,64 +734,29 @@ class TestDatabricksAdapter(DatabricksAdapterBase):
             "stats:rows:value": 14093476,
         }
 
-    def test_relation_with_database(self):
-        config = self._get_config()
-        adapter = DatabricksAdapter(config, get_context("spawn"))
+    def test_relation_with_database(self, adapter):
         r1 = adapter.Relation.create(schema="different", identifier="table")
         assert r1.database is None
         r2 = adapter.Relation.create(database="something", schema="different", identifier="table")
         assert r2.database == "something"
 
-    def test_parse_columns_from_information_with_table_type_and_delta_provider(self):
-        self.maxDiff = None
+    def test_parse_columns_from_information_with_table_type_and_delta_provider(self, adapter):
         rel_type = DatabricksRelation.get_relation_type.Table
 
-        # Mimics the output of Spark in the information column
-        information = (
-            "Database: default_schema\n"
-            "Table: mytable\n"
-            "Owner: root\n"
-            "Created Time: Wed Feb 04 18:15:00 UTC 1815\n"
-            "Last Access: Wed May 20 19:25:00 UTC 1925\n"
-            "Created By: Spark 3.0.1\n"
-            "Type: MANAGED\n"
-            "Provider: delta\n"
-            "Statistics: 123456789 bytes\n"
-            "Location: /mnt/vo\n"
-            "Serde Library: org.apache.hadoop.hive.serde2.lazy.LazySimpleSerDe\n"
-            "InputFormat: org.apache.hadoop.mapred.SequenceFileInputFormat\n"
-            "OutputFormat: org.apache.hadoop.hive.ql.io.HiveSequenceFileOutputFormat\n"
-            "Partition Provider: Catalog\n"
-            "Partition Columns: [`dt`]\n"
-            "Schema: root\n"
-            " |-- col1: decimal(22,0) (nullable = true)\n"
-            " |-- col2: string (nullable = true)\n"
-            " |-- dt: date (nullable = true)\n"
-            " |-- struct_col: struct (nullable = true)\n"
-            " |    |-- struct_inner_col: string (nullable = true)\n"
-        )
         relation = DatabricksRelation.create(
             schema="default_schema", identifier="mytable", type=rel_type
         )
 
-        config = self._get_config()
-        columns = DatabricksAdapter(config, get_context("spawn")).parse_columns_from_information(
-            relation, information
-        )
+        columns = adapter.parse_columns_from_information(relation, _TABLE_INFO)
         assert len(columns) == 4
         assert columns[0].to_column_dict(omit_none=False) == {
-            "table_database": None,
+            **_BASE_COLS,
             "table_schema": relation.schema,
             "table_name": relation.name,
             "table_type": rel_type,
-            "table_owner": "root",
-            "table_comment": None,
             "column": "col1",
             "column_index": 0,
             "dtype": "decimal(22,0)",
-            "numeric_scale": None,
-            "numeric_precision": None,
-            "char_size": None,
             "stats:bytes:description": "",
             "stats:bytes:include": True,
             "stats:bytes:label": "bytes",
@@ -720,150 +765,70 @@ class TestDatabricksAdapter(DatabricksAdapterBase):
         }
 
         assert columns[3].to_column_dict(omit_none=False) == {
-            "table_database": None,
+            **_BASE_COLS,
             "table_schema": relation.schema,
             "table_name": relation.name,
             "table_type": rel_type,
-            "table_owner": "root",
-            "table_comment": None,
             "column": "struct_col",
             "column_index": 3,
             "dtype": "struct",
             "comment": None,
-            "numeric_scale": None,
-            "numeric_precision": None,
-            "char_size": None,
             "stats:bytes:description": "",
             "stats:bytes:include": True,
             "stats:bytes:label": "bytes",
             "stats:bytes:value": 123456789,
         }
 
-    def test_parse_columns_from_information_with_view_type(self):
-        self.maxDiff = None
+    def test_parse_columns_from_information_with_view_type(self, adapter):
         rel_type = DatabricksRelation.get_relation_type.View
-        information = (
-            "Database: default_schema\n"
-            "Table: myview\n"
-            "Owner: root\n"
-            "Created Time: Wed Feb 04 18:15:00 UTC 1815\n"
-            "Last Access: UNKNOWN\n"
-            "Created By: Spark 3.0.1\n"
-            "Type: VIEW\n"
-            "View Text: WITH base (\n"
-            "    SELECT * FROM source_table\n"
-            ")\n"
-            "SELECT col1, col2, dt FROM base\n"
-            "View Original Text: WITH base (\n"
-            "    SELECT * FROM source_table\n"
-            ")\n"
-            "SELECT col1, col2, dt FROM base\n"
-            "View Catalog and Namespace: spark_catalog.default\n"
-            "View Query Output Columns: [col1, col2, dt]\n"
-            "Table Properties: [view.query.out.col.1=col1, view.query.out.col.2=col2, "
-            "transient_lastDdlTime=1618324324, view.query.out.col.3=dt, "
-            "view.catalogAndNamespace.part.0=spark_catalog, "
-            "view.catalogAndNamespace.part.1=default]\n"
-            "Serde Library: org.apache.hadoop.hive.serde2.lazy.LazySimpleSerDe\n"
-            "InputFormat: org.apache.hadoop.mapred.SequenceFileInputFormat\n"
-            "OutputFormat: org.apache.hadoop.hive.ql.io.HiveSequenceFileOutputFormat\n"
-            "Storage Properties: [serialization.format=1]\n"
-            "Schema: root\n"
-            " |-- col1: decimal(22,0) (nullable = true)\n"
-            " |-- col2: string (nullable = true)\n"
-            " |-- dt: date (nullable = true)\n"
-            " |-- struct_col: struct (nullable = true)\n"
-            " |    |-- struct_inner_col: string (nullable = true)\n"
-        )
         relation = DatabricksRelation.create(
             schema="default_schema", identifier="myview", type=rel_type
         )
 
-        config = self._get_config()
-        columns = DatabricksAdapter(config, get_context("spawn")).parse_columns_from_information(
-            relation, information
-        )
+        columns = adapter.parse_columns_from_information(relation, _VIEW_INFO)
         assert len(columns) == 4
         assert columns[1].to_column_dict(omit_none=False) == {
-            "table_database": None,
+            **_BASE_COLS,
             "table_schema": relation.schema,
             "table_name": relation.name,
             "table_type": rel_type,
-            "table_owner": "root",
-            "table_comment": None,
             "column": "col2",
             "column_index": 1,
             "comment": None,
             "dtype": "string",
-            "numeric_scale": None,
-            "numeric_precision": None,
-            "char_size": None,
         }
 
         assert columns[3].to_column_dict(omit_none=False) == {
-            "table_database": None,
+            **_BASE_COLS,
             "table_schema": relation.schema,
             "table_name": relation.name,
             "table_type": rel_type,
-            "table_owner": "root",
-            "table_comment": None,
             "column": "struct_col",
             "column_index": 3,
             "comment": None,
             "dtype": "struct",
-            "numeric_scale": None,
-            "numeric_precision": None,
-            "char_size": None,
         }
 
-    def test_parse_columns_from_information_with_table_type_and_parquet_provider(self):
-        self.maxDiff = None
+    def test_parse_columns_from_information_with_table_type_and_parquet_provider(self, adapter):
         rel_type = DatabricksRelation.get_relation_type.Table
 
-        information = (
-            "Database: default_schema\n"
-            "Table: mytable\n"
-            "Owner: root\n"
-            "Created Time: Wed Feb 04 18:15:00 UTC 1815\n"
-            "Last Access: Wed May 20 19:25:00 UTC 1925\n"
-            "Created By: Spark 3.0.1\n"
-            "Type: MANAGED\n"
-            "Provider: parquet\n"
-            "Statistics: 1234567890 bytes, 12345678 rows\n"
-            "Location: /mnt/vo\n"
-            "Serde Library: org.apache.hadoop.hive.ql.io.parquet.serde.ParquetHiveSerDe\n"
-            "InputFormat: org.apache.hadoop.hive.ql.io.parquet.MapredParquetInputFormat\n"
-            "OutputFormat: org.apache.hadoop.hive.ql.io.parquet.MapredParquetOutputFormat\n"
-            "Schema: root\n"
-            " |-- col1: decimal(22,0) (nullable = true)\n"
-            " |-- col2: string (nullable = true)\n"
-            " |-- dt: date (nullable = true)\n"
-            " |-- struct_col: struct (nullable = true)\n"
-            " |    |-- struct_inner_col: string (nullable = true)\n"
-        )
         relation = DatabricksRelation.create(
             schema="default_schema", identifier="mytable", type=rel_type
         )
 
-        config = self._get_config()
-        columns = DatabricksAdapter(config, get_context("spawn")).parse_columns_from_information(
-            relation, information
-        )
+        columns = adapter.parse_columns_from_information(relation, _PARQUET_TABLE_INFO)
         assert len(columns) == 4
+        # The statistics are parsed once per table and shared by its columns
+        assert all(column.table_stats is columns[0].table_stats for column in columns)
         assert columns[2].to_column_dict(omit_none=False) == {
-            "table_database": None,
+            **_BASE_COLS,
             "table_schema": relation.schema,
             "table_name": relation.name,
             "table_type": rel_type,
-            "table_owner": "root",
-            "table_comment": None,
             "column": "dt",
             "column_index": 2,
             "comment": None,
             "dtype": "date",
-            "numeric_scale": None,
-            "numeric_precision": None,
-            "char_size": None,
             "stats:bytes:description": "",
             "stats:bytes:include": True,
             "stats:bytes:label": "bytes",
@@ -875,19 +840,14 @@ class TestDatabricksAdapter(DatabricksAdapterBase):
         }
 
         assert columns[3].to_column_dict(omit_none=False) == {
-            "table_database": None,
+            **_BASE_COLS,
             "table_schema": relation.schema,
             "table_name": relation.name,
             "table_type": rel_type,
-            "table_owner": "root",
-            "table_comment": None,
             "column": "struct_col",
             "column_index": 3,
             "comment": None,
             "dtype": "struct",
-            "numeric_scale": None,
-            "numeric_precision": None,
-            "char_size": None,
             "stats:bytes:description": "",
             "stats:bytes:include": True,
             "stats:bytes:label": "bytes",
@@ -898,7 +858,7 @@ class TestDatabricksAdapter(DatabricksAdapterBase):
             "stats:rows:value": 12345678,
         }
 
-    def test_describe_table_extended_2048_char_limit(self):
+    def test_describe_table_extended_2048_char_limit(self, monkeypatch):
         """GIVEN a list of table_names whos total character length exceeds 2048 characters
         WHEN the environment variable DBT_DESCRIBE_TABLE_2048_CHAR_BYPASS is "true"
         THEN the identifier list is replaced with "*"
@@ -907,17 +867,17 @@ class TestDatabricksAdapter(DatabricksAdapterBase):
         table_names = set([f"customers_{i}" for i in range(200)])
 
         # By default, don't limit the number of characters
-        assert get_identifier_list_string(table_names) == "|".join(table_names)
+        assert get_identifier_list_string(table_names) == "|".join(sorted(table_names))
 
         # If environment variable is set, then limit the number of characters
-        with mock.patch.dict("os.environ", **{"DBT_DESCRIBE_TABLE_2048_CHAR_BYPASS": "true"}):
-            # Long list of table names is capped
-            assert get_identifier_list_string(table_names) == "*"
+        monkeypatch.setenv("DBT_DESCRIBE_TABLE_2048_CHAR_BYPASS", "true")
+        # Long list of table names is capped
+        assert get_identifier_list_string(table_names) == "*"
 
-            # Short list of table names is not capped
-            assert get_identifier_list_string(list(table_names)[:5]) == "|".join(
-                list(table_names)[:5]
-            )
+        # Short list of table names is not capped
+        assert get_identifier_list_string(list(table_names)[:5]) == "|".join(
+            sorted(list(table_names)[:5])
+        )
 
     def test_describe_table_extended_should_not_limit(self):
         """GIVEN a list of table_names whos total character length exceeds 2048 characters
@@ -928,9 +888,9 @@ class TestDatabricksAdapter(DatabricksAdapterBase):
         table_names = set([f"customers_{i}" for i in range(200)])
 
         # By default, don't limit the number of characters
-        assert get_identifier_list_string(table_names) == "|".join(table_names)
+        assert get_identifier_list_string(table_names) == "|".join(sorted(table_names))
 
-    def test_describe_table_extended_should_limit(self):
+    def test_describe_table_extended_should_limit(self, monkeypatch):
         """GIVEN a list of table_names whos total character length exceeds 2048 characters
         WHEN the environment variable DBT_DESCRIBE_TABLE_2048_CHAR_BYPASS is "true"
         THEN the identifier list is replaced with "*"
@@ -939,11 +899,11 @@ class TestDatabricksAdapter(DatabricksAdapterBase):
         table_names = set([f"customers_{i}" for i in range(200)])
 
         # If environment variable is set, then limit the number of characters
-        with mock.patch.dict("os.environ", **{"DBT_DESCRIBE_TABLE_2048_CHAR_BYPASS": "true"}):
-            # Long list of table names is capped
-            assert get_identifier_list_string(table_names) == "*"
+        monkeypatch.setenv("DBT_DESCRIBE_TABLE_2048_CHAR_BYPASS", "true")
+        # Long list of table names is capped
+        assert get_identifier_list_string(table_names) == "*"
 
-    def test_describe_table_extended_may_limit(self):
+    def test_describe_table_extended_may_limit(self, monkeypatch):
         """GIVEN a list of table_names whos total character length does not 2048 characters
         WHEN the environment variable DBT_DESCRIBE_TABLE_2048_CHAR_BYPASS is "true"
         THEN the identifier list is not truncated
@@ -952,11 +912,17 @@ class TestDatabricksAdapter(DatabricksAdapterBase):
         table_names = set([f"customers_{i}" for i in range(200)])
 
         # If environment variable is set, then we may limit the number of characters
-        with mock.patch.dict("os.environ", **{"DBT_DESCRIBE_TABLE_2048_CHAR_BYPASS": "true"}):
-            # But a short list of table names is not capped
-            assert get_identifier_list_string(list(table_names)[:5]) == "|".join(
-                list(table_names)[:5]
-            )
+        monkeypatch.setenv("DBT_DESCRIBE_TABLE_2048_CHAR_BYPASS", "true")
+        # But a short list of table names is not capped
+        assert get_identifier_list_string(list(table_names)[:5]) == "|".join(
+            sorted(list(table_names)[:5])
+        )
+
+    def test_describe_table_extended_is_ordered(self):
+        table_names = [f"customers_{i}" for i in range(5)]
+
+        assert get_identifier_list_string(set(table_names)) == "|".join(table_names)
+        assert get_identifier_list_string(table_names[::-1]) == "|".join(table_names)
 
 
 class TestCheckNotFound:
@@ -975,6 +941,11 @@ class TestCheckNotFound:
     def test_error_condition(self):
         assert check_not_found_error("[SCHEMA_NOT_FOUND]")
 
+    def test_table_or_view_not_found(self):
+        assert check_not_found_error("[TABLE_OR_VIEW_NOT_FOUND] The table `foo` cannot be found")
+        assert check_not_found_error("Table or view not found: foo")
+        assert check_not_found_error("org.apache.spark.sql.NoSuchTableException: foo")
+
     def test_unexpected_error(self):
         assert not check_not_found_error("[DATABASE_NOT_FOUND]")
         assert not check_not_found_error("Schema foo not found")
@@ -982,10 +953,6 @@ class TestCheckNotFound:
 
 
 class TestGetPersistDocColumns(DatabricksAdapterBase):
-    @pytest.fixture
-    def adapter(self, setUp) -> DatabricksAdapter:
-        return DatabricksAdapter(self._get_config(), get_context("spawn"))
-
     def create_column(self, name, comment) -> DatabricksColumn:
         return DatabricksColumn(
             column=name,
@@ -1,4 +1,7 @@
+import pytest
 from dbt.adapters.databricks import DatabricksColumn
+from dbt.adapters.databricks.relation import DatabricksRelationType
+from dbt.adapters.spark.column import SparkColumn
 
 
 class TestSparkColumn:
@@ -24,3 +27,29 @@ class TestSparkColumn:
             "stats:rows:label": "rows",
             "stats:rows:value": 12345678,
         }
+
+
+class TestToColumnDict:
+    @pytest.mark.parametrize(
+        "column",
+        [
+            DatabricksColumn(column="col1", dtype="string"),
+            DatabricksColumn(
+                column="col1",
+                dtype="decimal(22,0)",
+                table_schema="default_schema",
+                table_name="mytable",
+                table_type=DatabricksRelationType.Table,
+                table_owner="root",
+                table_stats=DatabricksColumn.convert_table_stats("123456789 bytes, 12 rows"),
+                column_index=0,
+                table_comment="Table model description",
+                comment="comment",
+            ),
+        ],
+    )
+    @pytest.mark.parametrize("omit_none", [True, False])
+    def test_matches_serialized_dict(self, column, omit_none):
+        assert column.to_column_dict(omit_none=omit_none) == SparkColumn.to_column_dict(
+            column, omit_none=omit_none
+        )
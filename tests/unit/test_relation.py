@@ -169,6 +169,21 @@ class TestDatabricksRelation:
         relation = DatabricksRelation.from_dict(data)
         assert not relation.matches("some_database", "some_schema", "table")
 
+    def test_create__shared_for_same_parts(self):
+        relation = DatabricksRelation.create("some_database", "some_schema", "some_table", "table")
+        assert relation is DatabricksRelation.create(
+            "some_database", "some_schema", "some_table", "table"
+        )
+        assert relation.type == relation.get_relation_type.Table
+
+    def test_create__with_kwargs(self):
+        metadata = {"Owner": "root"}
+        relation = DatabricksRelation.create(
+            "some_database", "some_schema", "some_table", metadata=metadata
+        )
+        assert relation.metadata == metadata
+        assert not DatabricksRelation.create("some_database", "some_schema", "some_table").metadata
+
 
 class TestRelationsFunctions:
     @pytest.mark.parametrize(